@@ -1,17 +1,72 @@
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import inspect
 from .staff_contact_router import router as staff_router
 import logging
-from .staff_contact_model import Staff
-from .staff_contact_database import engine
+from . import staff_contact_model  # noqa: F401  (registers the tables on Base.metadata)
+from .staff_contact_database import Base, engine, POOL_SIZE, MAX_OVERFLOW
+from .staff_contact_settings import get_settings
 
-Staff.metadata.create_all(bind=engine)
 
+def _optimize_database():
+    # Refresh stale planner statistics (README.md, "SQLite")
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as connection:
+        connection.exec_driver_sql("PRAGMA optimize")
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Configure logging when the server starts, not when the module is imported,
+    # so importing the app (tests, tooling) leaves the root logger untouched.
+    # basicConfig is a no-op if the root logger already has handlers.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+    )
+
+    # Create missing tables once per process start, and only when explicitly
+    # enabled (AUTO_CREATE_TABLES=1, development). Listing the existing tables
+    # is a single query, whereas create_all checks every table one by one, so
+    # skip it entirely when the schema is already there.
+    if get_settings().auto_create_tables:
+        with engine.begin() as connection:
+            if not set(inspect(connection).get_table_names()) >= set(Base.metadata.tables):
+                Base.metadata.create_all(bind=connection)
+
+    # One worker thread per pooled connection (AnyIO defaults to 40 threads)
+    to_thread.current_default_thread_limiter().total_tokens = POOL_SIZE + MAX_OVERFLOW
+
+    await to_thread.run_sync(_optimize_database)
+    try:
+        yield
+    finally:
+        await to_thread.run_sync(_optimize_database)
+
+
+# ORJSONResponse encodes JSON (including date/datetime) in native code instead
+# of the stdlib json module.
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.include_router(staff_router)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
-)
\ No newline at end of file
+
+if __name__ == "__main__":
+    # python -m Cr_StaffContactInformation.app.main
+    # uvloop (event loop) and httptools (HTTP parser) are the C-accelerated
+    # implementations bundled with uvicorn[standard]; select them explicitly so
+    # a missing extra fails loudly instead of silently falling back to asyncio/h11.
+    import uvicorn
+
+    settings = get_settings()
+    uvicorn.run(
+        "Cr_StaffContactInformation.app.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        loop="uvloop",
+        http="httptools",
+    )
\ No newline at end of file
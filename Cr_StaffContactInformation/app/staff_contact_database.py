@@ -24,34 +24,72 @@ Who imports from this file?
 # IMPORTS
 # ============================================================================
 from sqlalchemy import create_engine          # Builds the engine (DB connection)
+from sqlalchemy import event                  # Hooks into engine/pool lifecycle events
 from sqlalchemy.orm import sessionmaker        # Builds the session factory
-from sqlalchemy.orm import declarative_base    # Builds the Base class for ORM models
-from dotenv import load_dotenv                 # Reads .env file into os.environ
-import os
-
-# Load .env variables into the environment BEFORE reading them
-# This means DATABASE_URL= in .env becomes available via os.getenv()
-load_dotenv()
+from sqlalchemy.orm import DeclarativeBase     # Parent class for ORM models (SQLAlchemy 2.0)
+from sqlalchemy.pool import StaticPool         # Single shared connection (in-memory DBs)
+from .staff_contact_settings import get_settings  # Cached env/.env configuration
 
 # ============================================================================
 # STEP 1 — THE ENGINE
 # ============================================================================
-import os
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.orm import declarative_base
-
-load_dotenv()
-
-
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./hospital.db")
+DATABASE_URL = get_settings().database_url
+
+# Connection pool tuning:
+#   pool_size / max_overflow → up to 20 persistent + 10 burst connections.
+#                              The endpoints are sync, so FastAPI runs each one on
+#                              AnyIO's threadpool and every thread holds a pooled
+#                              connection for the whole request; main.py caps that
+#                              threadpool at POOL_SIZE + MAX_OVERFLOW so extra
+#                              requests queue for a thread instead of timing out.
+#   pool_timeout             → seconds to wait for a free connection before erroring
+#   pool_pre_ping            → cheap liveness check on checkout, drops stale connections
+#   pool_recycle             → replace connections older than an hour
+# An in-memory database only exists inside the connection that created it, so
+# that case gets a StaticPool (one shared connection) instead.
+POOL_SIZE = 20
+MAX_OVERFLOW = 10
+
+if DATABASE_URL in ("sqlite://", "sqlite:///:memory:"):
+    pool_options = {"poolclass": StaticPool}
+else:
+    pool_options = {
+        "pool_size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+    }
+
+# check_same_thread=False lets pooled SQLite connections move between FastAPI's
+# worker threads; it is a sqlite3-only argument that other drivers reject.
+connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
 
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args=connect_args,
+    **pool_options,
 )
 
+
+# SQLite settings, applied to every new pooled DBAPI connection (the PRAGMAs
+# are per-connection). Same list in app/ and Cr_StaffContactInformation/; the
+# reasons are in README.md, "SQLite".
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")      # negative = KiB → 64 MB
+        cursor.execute("PRAGMA mmap_size=268435456")    # 256 MB
+        cursor.execute("PRAGMA busy_timeout=5000")      # milliseconds
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA analysis_limit=400")     # rows per index for ANALYZE/optimize
+        cursor.close()
+
+
 # ============================================================================
 # STEP 2 — THE SESSION FACTORY (SessionLocal)
 # ============================================================================
@@ -74,7 +112,8 @@ SessionLocal = sessionmaker(
 # ============================================================================
 # STEP 3 — THE DECLARATIVE BASE
 # ============================================================================
-# declarative_base() returns a Base class.
+# Base subclasses SQLAlchemy 2.0's DeclarativeBase (the typed successor of the
+# legacy declarative_base() factory).
 # Every ORM model in this project (e.g., Specialty in models.py) will inherit
 # from this Base. When a class inherits from Base, SQLAlchemy registers it
 # internally and knows its table name and column definitions.
@@ -84,7 +123,8 @@ SessionLocal = sessionmaker(
 # iterates over every registered model and issues:
 #   CREATE TABLE IF NOT EXISTS specialties (...);
 # for each one that doesn't already exist in the database.
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
 
 
 # ============================================================================
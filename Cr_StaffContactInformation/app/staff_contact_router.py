@@ -10,35 +10,40 @@ router = APIRouter(
 )
 
 
+# The service already returns a validated StaffResponse, so response_model=None
+# skips FastAPI's second validation pass; `responses` keeps the schema in /docs.
 @router.post(
     "/",
-    response_model=StaffResponse,
+    response_model=None,
+    responses={status.HTTP_201_CREATED: {"model": StaffResponse}},
     status_code=status.HTTP_201_CREATED
 )
 def create_staff_endpoint(
     staff: StaffCreate,
     db: Session = Depends(get_db)
-):
+) -> StaffResponse:
     return create_staff(db, staff)
 
 
 @router.get(
     "/{staff_id}",
-    response_model=StaffResponse
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": StaffResponse}}
 )
 def get_staff_endpoint(
     staff_id: int,
     db: Session = Depends(get_db)
-):
+) -> StaffResponse:
     return get_staff(db, staff_id)
 
 @router.patch(
     "/{staff_id}",
-    response_model=StaffResponse
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": StaffResponse}}
 )
 def update_staff_endpoint(
     staff_id: int,
     staff_update: StaffUpdate,
     db: Session = Depends(get_db)
-):
+) -> StaffResponse:
     return update_staff(db, staff_id, staff_update)
\ No newline at end of file
@@ -1,44 +1,96 @@
 import logging
+from sqlalchemy import exists, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
 from .staff_contact_model import Staff
-from .staff_contact_schema import StaffCreate
+from .staff_contact_schema import StaffCreate, StaffResponse
 from fastapi import HTTPException, status
 
 logger = logging.getLogger(__name__)
 
 
-def create_staff(db: Session, staff_data: StaffCreate) -> Staff:
+def _email_registered(db: Session, email: str) -> bool:
+    """
+    Whether a staff member already has this email. Only asked after a write
+    failed with IntegrityError: a yes means it was the unique index on
+    staff.email, a no means some other constraint (foreign keys...).
+    """
+    return db.execute(select(exists().where(Staff.email == email))).scalar_one()
+
+
+# on_conflict_do_nothing() needs the SQLite or PostgreSQL insert(); on other
+# databases create_staff falls back to the generic one.
+_ON_CONFLICT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def create_staff(db: Session, staff_data: StaffCreate) -> StaffResponse:
     """
     Creates a new staff record with validation and traceability.
     """
 
-    existing_staff = db.query(Staff).filter(Staff.email == staff_data.email).first()
-    if existing_staff:
+    # One round trip: the unique index on staff.email does the duplicate check.
+    # ON CONFLICT DO NOTHING turns a duplicate into "no row returned" instead of
+    # an IntegrityError, and RETURNING hands back the inserted row (including
+    # server defaults such as created_at) without a follow-up SELECT. Without
+    # ON CONFLICT (other databases) the duplicate raises IntegrityError instead.
+    on_conflict_insert = _ON_CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if on_conflict_insert is not None:
+        stmt = (
+            on_conflict_insert(Staff)
+            .values(**staff_data.model_dump())
+            .on_conflict_do_nothing(index_elements=[Staff.email])
+        )
+    else:
+        stmt = insert(Staff).values(**staff_data.model_dump())
+    try:
+        new_staff = db.execute(stmt.returning(Staff)).scalar_one_or_none()
+    except IntegrityError:
+        db.rollback()
+        if not _email_registered(db, staff_data.email):
+            # With foreign_keys=ON the other constraint the INSERT can hit is
+            # an unknown department/specialty.
+            logger.warning(
+                f"Attempt to create staff with unknown department {staff_data.department_id} "
+                f"or specialty {staff_data.specialty_id}"
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Department or specialty not found"
+            )
+        new_staff = None
+
+    if new_staff is None:
+        db.rollback()
         logger.warning(f"Attempt to create staff with duplicate email: {staff_data.email}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
-    new_staff = Staff(**staff_data.model_dump())
-
-    db.add(new_staff)
+    # Build the response BEFORE commit(): committing expires new_staff, and
+    # reading it afterwards would re-SELECT the row RETURNING already gave us.
+    response = StaffResponse.model_validate(new_staff)
     db.commit()
-    db.refresh(new_staff)
 
-    logger.info(f"Staff created successfully with ID: {new_staff.id}")
+    logger.info(f"Staff created successfully with ID: {response.id}")
 
-    return new_staff
+    return response
 
 
-def get_staff(db: Session, staff_id: int) -> Staff:
+def get_staff(db: Session, staff_id: int) -> StaffResponse:
     """
     Retrieves a staff record by ID.
+
+    Read-only path: fetches a plain Core row instead of an ORM instance, so no
+    identity-map or attribute-instrumentation work is done for an object that
+    is only going to be serialized.
     """
 
-    staff = db.query(Staff).filter(Staff.id == staff_id).first()
+    stmt = select(Staff.__table__).where(Staff.__table__.c.id == staff_id)
+    row = db.execute(stmt).first()
 
-    if not staff:
+    if row is None:
         logger.warning(f"Staff not found with ID: {staff_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -47,33 +99,38 @@ def get_staff(db: Session, staff_id: int) -> Staff:
 
     logger.info(f"Staff retrieved successfully: {staff_id}")
 
-    return staff
+    return StaffResponse.model_validate(row._mapping)
 
 
 def update_staff(db, staff_id: int, staff_update):
-    staff = db.query(Staff).filter(Staff.id == staff_id).first()
+    staff = db.get(Staff, staff_id)
 
     if not staff:
         raise HTTPException(status_code=404, detail="Staff not found")
 
     update_data = staff_update.model_dump(exclude_unset=True)
 
-    if "email" in update_data:
-        existing = db.query(Staff).filter(
-            Staff.email == update_data["email"],
-            Staff.id != staff_id
-        ).first()
-
-        if existing:
-            raise HTTPException(
-                status_code=400,
-                detail="Email already in use"
-            )
-
     for field, value in update_data.items():
         setattr(staff, field, value)
 
+    # No "is this email taken?" SELECT first: the unique index on staff.email
+    # rejects a duplicate in the UPDATE itself, atomically and in the same
+    # round trip. flush() sends the UPDATE so the violation surfaces here.
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        if "email" not in update_data or not _email_registered(db, update_data["email"]):
+            raise
+        logger.warning(f"Attempt to update staff {staff_id} with duplicate email: {update_data['email']}")
+        raise HTTPException(
+            status_code=400,
+            detail="Email already in use"
+        )
+
+    # Build the response BEFORE commit(), as in create_staff: committing would
+    # expire staff and reading it afterwards would re-SELECT the row.
+    response = StaffResponse.model_validate(staff)
     db.commit()
-    db.refresh(staff)
 
-    return staff
\ No newline at end of file
+    return response
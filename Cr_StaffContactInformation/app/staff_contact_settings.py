@@ -0,0 +1,42 @@
+"""
+staff_contact_settings.py
+-------------------------
+Single Responsibility: Read configuration from the environment exactly once.
+
+Settings are parsed from environment variables (and a .env file, if present)
+the first time get_settings() is called. The result is cached, so later
+imports and calls never touch the filesystem or os.environ again.
+
+Who imports from this file?
+  - app/staff_contact_database.py  reads database_url to build the engine
+  - app/main.py                    reads auto_create_tables on startup and
+                                   host/port/workers when run as a script
+"""
+
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    # Populated from DATABASE_URL (env var names are case-insensitive)
+    database_url: str = "sqlite:///./hospital.db"
+
+    # AUTO_CREATE_TABLES=1 lets the app create missing tables on startup
+    # (development only; deployed databases get their schema from migrations)
+    auto_create_tables: bool = False
+
+    # Server options, only used when main.py is run directly
+    host: str = "127.0.0.1"
+    port: int = 8000
+    workers: int = 4
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Build the Settings object on first use and return the same instance after.
+    """
+    return Settings()
@@ -1,24 +1,52 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from Cr_StaffContactInformation.app.main import app
-from Cr_StaffContactInformation.app.staff_contact_database import Base, engine
+from Cr_StaffContactInformation.app.staff_contact_database import Base, get_db
 from Cr_StaffContactInformation.app.staff_contact_model import Department, Specialty
 
-client = TestClient(app)
+# Base de datos SQLite en memoria, compartida por todas las sesiones gracias a
+# StaticPool: los tests nunca tocan hospital.db y no hay I/O de disco.
+test_engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+
+# Igual que en producción: SQLite solo valida las FK con foreign_keys=ON
+@event.listens_for(test_engine, "connect")
+def _enable_foreign_keys(dbapi_connection, connection_record):
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
 
 
-def setup_module():
-    Base.metadata.create_all(bind=engine)
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
 
 
-def teardown_module():
-    Base.metadata.drop_all(bind=engine)
+@pytest.fixture(scope="module", autouse=True)
+def setup_test_db():
+    # Las tablas se crean una sola vez para todo el módulo
+    Base.metadata.create_all(bind=test_engine)
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+    Base.metadata.drop_all(bind=test_engine)
+    app.dependency_overrides.pop(get_db, None)
+
+
+client = TestClient(app)
 
 
 def test_create_staff():
-    db = Session(bind=engine)
+    db = TestingSessionLocal()
 
     # Crear registros requeridos por las FK
     department = Department(
@@ -59,7 +87,7 @@ def test_create_staff():
     assert data["department_id"] == department.id
 
 def test_get_staff():
-    db = Session(bind=engine)
+    db = TestingSessionLocal()
 
     # Crear registros necesarios
     department = Department(
@@ -110,7 +138,7 @@ def test_get_staff():
     assert data["email"] == "carlos.perez@test.com"
 
 def test_update_staff_first_name():
-    db = Session(bind=engine)
+    db = TestingSessionLocal()
 
     department = Department(name="TestDept", description="Desc")
     specialty = Specialty(name="TestSpec", description="Desc")
@@ -147,7 +175,7 @@ def test_update_staff_first_name():
     assert update_response.json()["first_name"] == "NuevoNombre"
 
 def test_update_email_duplicate():
-    db = Session(bind=engine)
+    db = TestingSessionLocal()
 
     department = Department(name="DeptX", description="Desc")
     specialty = Specialty(name="SpecX", description="Desc")
@@ -203,7 +231,7 @@ def test_update_staff_not_found():
     assert response.status_code == 404
 
 def test_update_restricted_field():
-    db = Session(bind=engine)
+    db = TestingSessionLocal()
 
     department = Department(name="DeptY", description="Desc")
     specialty = Specialty(name="SpecY", description="Desc")
@@ -238,3 +266,29 @@ def test_update_restricted_field():
 
     assert response.status_code == 422
 
+
+def test_update_null_required_field():
+    # null en una columna NOT NULL se rechaza en la validación (422), no se
+    # confunde con un email duplicado
+    response = client.patch("/api/staff/9999", json={"email": None})
+    assert response.status_code == 422
+
+    response = client.patch("/api/staff/9999", json={"email": "b@test.com", "first_name": None})
+    assert response.status_code == 422
+
+
+def test_create_staff_unknown_department():
+    # Una FK inexistente se informa como 400, no como un 500 sin manejar
+    response = client.post("/api/staff/", json={
+        "first_name": "Luis",
+        "last_name": "Diaz",
+        "email": "luis.diaz@test.com",
+        "phone_number": "12345678",
+        "start_date": "2024-01-01",
+        "status": "Active",
+        "role_level": "Junior",
+        "department_id": 999,
+        "specialty_id": 999
+    })
+
+    assert response.status_code == 400
@@ -9,77 +9,296 @@ It is the ONLY file allowed to speak directly to the database via SQLAlchemy.
 
 Imported by: routers/specialties.py
 Imports from:
-  - sqlalchemy.orm (Session)
-  - sqlalchemy (func)
+  - sqlalchemy.orm (Session, contains_eager, joinedload, selectinload)
+  - sqlalchemy (Row, String, Text, bindparam, exists, func, insert, literal, or_, select, update)
+  - sqlalchemy.dialects (postgresql, sqlite)
   - app.models (Specialty)
   - app.schemas (SpecialtyCreate)
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+import threading
+import time
+from collections.abc import Iterable
+from itertools import islice
 
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Row, String, Text, bindparam, exists, func, insert, literal, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 
-from app.models import Staff, Department, Specialty
+
+from app.models import Staff, Department, Specialty, User
 from app.schemas import SpecialtyCreate, StaffSelfUpdate
 
 
-def get_all_specialties(db: Session) -> list[Specialty]:
+# ============================================================================
+# PREBUILT STATEMENTS FOR THE STAFF PROFILE UPDATE
+# ============================================================================
+# These run on every PATCH /staff/update-profile. Building them once here, with
+# bindparam() placeholders for the values, means each call skips constructing
+# the Select object and regenerating its cache key; the compiled SQL comes
+# straight from the engine's statement cache.
+_STAFF_WITH_RELATIONS_BY_ID = (
+    select(Staff)
+    .where(Staff.id == bindparam("staff_id"))
+    .options(
+        joinedload(Staff.user),
+        joinedload(Staff.department),
+        joinedload(Staff.specialty),
+    )
+)
+
+# Fields a staff member may change on their own profile (see StaffSelfUpdate)
+_STAFF_SELF_FIELDS = frozenset({
+    "first_name",
+    "last_name",
+    "phone_number",
+    "profile_pic",
+    "status",
+    "role_level",
+})
+
+_STAFF_USER_ID_BY_ID = select(Staff.user_id).where(Staff.id == bindparam("staff_id"))
+
+_UPDATE_STAFF_BY_ID = update(Staff).where(Staff.id == bindparam("staff_id"))
+
+_UPDATE_EMAIL_BY_USER_ID = (
+    update(User)
+    .where(User.id == bindparam("user_id"))
+    .values(email=bindparam("new_email"))
+    .execution_options(synchronize_session=False)
+)
+
+
+# ============================================================================
+# SPECIALTIES LIST CACHE
+# ============================================================================
+# The specialties catalog is read-mostly: every GET /specialties would hit the
+# database for the same handful of rows. Pages are kept in memory for a short
+# time, keyed by their (skip, limit, after_id) arguments.
+#   - create_specialty / create_specialties_bulk clear it after committing.
+#   - Each uvicorn worker has its own copy, so a write made through another
+#     worker is seen here after at most _SPECIALTIES_CACHE_TTL seconds.
+#   - Every clear bumps a generation counter. A page read before a clear is
+#     not stored after it, otherwise a GET racing a create would put the old
+#     page back and hide the new specialty until the TTL runs out.
+_SPECIALTIES_CACHE_TTL = 30.0
+_SPECIALTIES_CACHE_MAX_PAGES = 256
+_specialties_cache: dict[tuple, tuple[float, list[Row], int]] = {}
+_specialties_cache_generation = 0
+_specialties_cache_lock = threading.Lock()
+
+
+def clear_specialties_cache() -> None:
     """
-    Retrieve all specialties from the database.
-    
-    Equivalent SQL:
-        SELECT * FROM specialties;
+    Forget every cached specialties page (called after any write).
     """
-    # db.query(Specialty) creates a SELECT statement targeted at the specialties table
-    # .all() executes the statement and returns all resulting rows as a Python list
-    return db.query(Specialty).all()
+    global _specialties_cache_generation
+    with _specialties_cache_lock:
+        _specialties_cache_generation += 1
+        _specialties_cache.clear()
 
 
-def get_specialty_by_name(db: Session, name: str) -> Specialty | None:
+def get_specialties_page(
+    db: Session,
+    skip: int = 0,
+    limit: int | None = None,
+    after_id: int | None = None
+) -> tuple[list[Row], int]:
+    """
+    Retrieve one page of specialties together with the total number of rows,
+    served from the in-memory cache while it is fresh (see above).
     """
-    Query the database for a specialty by its name.
-    Performs a case-insensitive search (e.g., 'cardio' matches 'Cardio').
-    
+    key = (skip, limit, after_id)
+    cached = _specialties_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _SPECIALTIES_CACHE_TTL:
+        return cached[1], cached[2]
+
+    generation = _specialties_cache_generation
+    items, total = _fetch_specialties_page(db, skip, limit, after_id)
+
+    with _specialties_cache_lock:
+        # Cleared while we were reading: this page may already be stale.
+        if generation == _specialties_cache_generation:
+            # Arbitrary cursors could otherwise grow the cache without bound.
+            if len(_specialties_cache) >= _SPECIALTIES_CACHE_MAX_PAGES:
+                _specialties_cache.clear()
+            _specialties_cache[key] = (time.monotonic(), items, total)
+    return items, total
+
+
+def _fetch_specialties_page(
+    db: Session,
+    skip: int,
+    limit: int | None,
+    after_id: int | None
+) -> tuple[list[Row], int]:
+    """
+    Query one page of specialties and the total number of rows (uncached).
+
+    Two ways to page through the catalog:
+      - after_id (keyset): return the rows whose id is greater than the last
+        id the client has seen. The WHERE is an index range scan on the
+        primary key, so every page costs the same no matter how deep it is.
+      - skip (offset): the database still walks and discards `skip` rows
+        before the page starts; fine for the first few pages only.
+
     Equivalent SQL:
-        SELECT * FROM specialties WHERE LOWER(name) = LOWER('cardio') LIMIT 1;
+        SELECT id, name, description, created_at,
+               (SELECT COUNT(*) FROM specialties) AS total
+        FROM specialties WHERE id > :after_id
+        ORDER BY id LIMIT :limit OFFSET :skip;
+
+    The uncorrelated COUNT(*) subquery is evaluated once per statement, so
+    "page + total" costs a single round trip. (A COUNT(*) OVER () window
+    would only count the rows left after the cursor.)
+
+    The page is returned as plain Core rows (named tuples: row.id, row.name,
+    ...), not Specialty objects: it is read-only and only feeds SpecialtyOut,
+    so building ORM instances and registering them in the identity map would
+    be wasted work.
     """
-    # func.lower() translates into the SQL LOWER() function.
-    # We apply it to both the database column and the incoming string
-    # to guarantee a case-insensitive match regardless of how it was typed.
-    return db.query(Specialty).filter(
-        func.lower(Specialty.name) == func.lower(name)
-    ).first()
+    total = select(func.count()).select_from(Specialty)
+    stmt = (
+        select(
+            Specialty.id,
+            Specialty.name,
+            Specialty.description,
+            Specialty.created_at,
+            total.scalar_subquery().label("total"),
+        )
+        .order_by(Specialty.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    if after_id is not None:
+        stmt = stmt.where(Specialty.id > after_id)
+    rows = db.execute(stmt).all()
+
+    if rows:
+        # The extra "total" column is ignored by SpecialtyOut.
+        return list(rows), rows[0].total
+
+    # An empty page carries no count: only ask for it when we are past the
+    # first page (the table itself may be non-empty).
+    if skip or after_id is not None:
+        return [], db.execute(total).scalar_one()
+    return [], 0
 
 
 def get_specialty(db: Session, specialty_id: int) -> Specialty | None:
     """
     Retrieve a single specialty by its ID.
     """
-    return db.query(Specialty).filter(Specialty.id == specialty_id).first()
+    # Session.get() checks the identity map first and only emits
+    # SELECT ... WHERE id = ? when the specialty isn't already loaded.
+    return db.get(Specialty, specialty_id)
+
+
+# INSERT ... ON CONFLICT DO NOTHING only exists in SQLAlchemy's SQLite and
+# PostgreSQL dialects. Any other database gets a plain INSERT, and a concurrent
+# duplicate then surfaces as an IntegrityError instead of "no row".
+_ON_CONFLICT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
 
 
-def create_specialty(db: Session, specialty: SpecialtyCreate) -> Specialty:
+def create_specialty(db: Session, specialty: SpecialtyCreate) -> Specialty | None:
     """
-    Insert a new specialty record into the database.
+    Insert a new specialty record into the database, unless one with the same
+    name (case-insensitive) already exists. Returns None in that case.
+
+    Equivalent SQL:
+        INSERT INTO specialties (name, description)
+        SELECT ?, ? WHERE NOT EXISTS (
+            SELECT 1 FROM specialties WHERE LOWER(name) = LOWER(?)
+        )
+        ON CONFLICT DO NOTHING
+        RETURNING id, name, description, created_at;
     """
-    # Step 1: Create a SQLAlchemy ORM object from the Pydantic schema data
-    db_specialty = Specialty(
-        name=specialty.name,
-        description=specialty.description
+    # Step 1: Check + INSERT + read back in ONE atomic statement. There is no
+    # window between "check" and "insert" for a concurrent request to slip
+    # through, and no separate lookup round trip:
+    #   - NOT EXISTS applies the case-insensitive rule even on databases created
+    #     before the ix_specialties_name_lower index existed. The new name is
+    #     lowered in SQL too, NOT with Python's str.lower(): SQLite's LOWER()
+    #     only folds ASCII, so 'ÁREA' would become 'área' in Python but stay
+    #     'Área' in the index and an exact duplicate would slip past the check.
+    #   - ON CONFLICT DO NOTHING turns a unique-index violation (a concurrent
+    #     insert of the same name) into "no row" instead of an IntegrityError.
+    #   - RETURNING hands back the new row (including the generated 'id' and
+    #     'created_at'), or nothing if the name was taken.
+    # (The values are bound with literal() rather than passed as execute()
+    # parameters, which ORM INSERT ... FROM SELECT does not accept; they still
+    # travel as bound parameters, so the compiled SQL is cached and reused.)
+    new_row = select(
+        literal(specialty.name, String),
+        literal(specialty.description, Text),
+    ).where(
+        ~exists().where(func.lower(Specialty.name) == func.lower(specialty.name))
     )
-    
-    # Step 2: Add it to the session (marks it as "to be inserted")
-    db.add(db_specialty)
-    
+    columns = [Specialty.name, Specialty.description]
+    on_conflict_insert = _ON_CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if on_conflict_insert is not None:
+        stmt = on_conflict_insert(Specialty).from_select(columns, new_row).on_conflict_do_nothing()
+    else:
+        stmt = insert(Specialty).from_select(columns, new_row)
+    try:
+        db_specialty = db.execute(stmt.returning(Specialty)).scalar_one_or_none()
+    except IntegrityError:
+        db_specialty = None
+
+    if db_specialty is None:
+        db.rollback()
+        return None
+
+    # Step 2: Detach the object from the session. commit() expires every object
+    # the session tracks, and reading an expired object re-SELECTs its row —
+    # exactly the query RETURNING just saved us.
+    db.expunge(db_specialty)
+
     # Step 3: Commit the transaction (writes it to the physical database file)
     db.commit()
-    
-    # Step 4: Refresh the instance (re-reads the row from DB to populate 'id' and 'created_at')
-    db.refresh(db_specialty)
-    
-    # Step 5: Return the populated object
+    clear_specialties_cache()
+
+    # Step 4: Return the populated object
     return db_specialty
 
+
+def create_specialties_bulk(
+    db: Session,
+    items: Iterable[SpecialtyCreate],
+    batch_size: int = 1000
+) -> int:
+    """
+    Insert many specialties at once (seeders, catalog imports).
+    Returns the number of rows inserted.
+
+    Passing a list of dicts to a Core insert() on the specialties TABLE sends
+    each batch as ONE executemany() call on the same compiled statement:
+        INSERT INTO specialties (name, description) VALUES (?, ?)
+    instead of one INSERT round trip per specialty. (The ORM bulk path,
+    insert(Specialty), drops None values and groups rows by the keys left, so
+    specialties with and without a description would split into many INSERTs.)
+
+    The input is consumed in chunks of `batch_size` so only one chunk of
+    parameter dicts is held in memory at a time. Everything is committed once
+    at the end (all-or-nothing): a duplicate name raises IntegrityError and
+    nothing is saved.
+    """
+    total = 0
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        db.execute(insert(Specialty.__table__), [item.model_dump() for item in batch])
+        total += len(batch)
+
+    db.commit()
+    clear_specialties_cache()
+    return total
+
+
+# Resolved once at import: the Staff model doesn't change at runtime
+_STAFF_LOCATION = getattr(Staff, "location", None)
+
+
 def search_staff(
     db: Session,
     name: str | None = None,
@@ -95,12 +314,30 @@ def search_staff(
     - location: matches location (if Staff has this field)
     """
 
-    # Start query joining Department and Specialty for filtering
-    query = db.query(Staff).join(Department).join(Specialty)
+    # Start query joining Department and Specialty for filtering.
+    # The router reads staff.department, staff.specialty and staff.user for every
+    # row, so load them up front instead of lazily (one SELECT per row each):
+    #   - contains_eager reuses the Department/Specialty columns already joined
+    #   - selectinload fetches all users in a single extra "WHERE id IN (...)" query
+    stmt = (
+        select(Staff)
+        .join(Staff.department)
+        .join(Staff.specialty)
+        .options(
+            contains_eager(Staff.department),
+            contains_eager(Staff.specialty),
+            selectinload(Staff.user),
+        )
+    )
+
+    # Each filter is only added when it was requested. That gives at most one
+    # statement shape per filter combination, and the search text is sent as a
+    # bound parameter (not part of the cache key), so every shape is compiled
+    # once and then served from SQLAlchemy's compiled-statement cache.
 
     # Filter by name (first or last)
     if name:
-        query = query.filter(
+        stmt = stmt.where(
             or_(
                 Staff.first_name.ilike(f"%{name}%"),
                 Staff.last_name.ilike(f"%{name}%")
@@ -109,51 +346,70 @@ def search_staff(
 
     # Filter by department name
     if department:
-        query = query.filter(Department.name.ilike(f"%{department}%"))
+        stmt = stmt.where(Department.name.ilike(f"%{department}%"))
 
     # Filter by role level
     if role:
-        query = query.filter(Staff.role_level.ilike(f"%{role}%"))
+        stmt = stmt.where(Staff.role_level.ilike(f"%{role}%"))
 
     # Filter by location (if exists in Staff model)
-    if location and hasattr(Staff, "location"):
-        query = query.filter(getattr(Staff, "location").ilike(f"%{location}%"))
+    if location and _STAFF_LOCATION is not None:
+        stmt = stmt.where(_STAFF_LOCATION.ilike(f"%{location}%"))
 
     # Return all matching results
-    return query.all()
+    return list(db.scalars(stmt).all())
+
+def email_in_use(db: Session, email: str) -> bool:
+    """
+    True if a user account already has this email.
+
+    Called only after an UPDATE failed with IntegrityError, to tell the unique
+    index on users.email apart from other constraint failures without parsing
+    the driver's error message.
+    """
+    return db.execute(select(exists().where(User.email == email))).scalar_one()
 
-def update_staff_contact_info(db: Session, update_data: StaffSelfUpdate):
-    # 1. Buscar al empleado por el ID que viene en el JSON
-    db_staff = db.query(Staff).filter(Staff.id == update_data.staff_id).first()
-    
-    if not db_staff:
-        return None
 
-    # 2. Convertir el esquema a dict, pero quitamos 'staff_id' porque ese no se actualiza
+def update_staff_contact_info(db: Session, update_data: StaffSelfUpdate):
+    # 1. Convertir el esquema a dict, pero quitamos 'staff_id' porque ese no se actualiza
     payload = update_data.model_dump(exclude_unset=True)
-    payload.pop("staff_id", None) 
-    
-    staff_fields = {
-        "first_name",
-        "last_name",
-        "phone_number",
-        "profile_pic",
-        "status",
-        "role_level"
-    }
-
-    # 3. Actualizar solo los campos enviados (email, phone, etc.)
+    staff_id = payload.pop("staff_id")
+
     # email se persiste en users
     # el resto se persiste en staff
     # para evitar meter campos incorrectos en la entidad equivocada.
-    for key, value in payload.items():
-        if key == "email":
-            if not db_staff.user:
-                return None
-            db_staff.user.email = value
-        elif key in staff_fields:
-            setattr(db_staff, key, value)
+    staff_values = {key: value for key, value in payload.items() if key in _STAFF_SELF_FIELDS}
+
+    # 2. Comprobar que el empleado existe, y de paso obtener su usuario (el
+    # email vive en users). Una lectura por clave primaria: el número de filas
+    # que devuelve un UPDATE no sirve para esto (MySQL solo cuenta las filas
+    # que cambian, así que un email igual al actual daría 0).
+    user_id = db.execute(_STAFF_USER_ID_BY_ID, {"staff_id": staff_id}).scalar_one_or_none()
+    if user_id is None:
+        return None
 
+    # 3. Escribir con UPDATE de Core, sin cargar antes el objeto ORM: no hay
+    # seguimiento de cambios por atributo. Si la base de datos rechaza el
+    # cambio (p. ej. email duplicado) se deshace todo antes de propagar el error.
+    try:
+        if "email" in payload:
+            db.execute(
+                _UPDATE_EMAIL_BY_USER_ID,
+                {"user_id": user_id, "new_email": payload["email"]},
+            )
+
+        if staff_values:
+            db.execute(
+                _UPDATE_STAFF_BY_ID.values(**staff_values),
+                {"staff_id": staff_id},
+                execution_options={"synchronize_session": False},
+            )
+    except IntegrityError:
+        db.rollback()
+        raise
     db.commit()
-    db.refresh(db_staff)
-    return db_staff
+
+    # 4. Leer el empleado ya actualizado junto con user, department y specialty
+    # en una sola consulta (LEFT OUTER JOIN): el router lee los tres. Si no
+    # existe, devuelve None.
+    return db.execute(_STAFF_WITH_RELATIONS_BY_ID, {"staff_id": staff_id}).scalar_one_or_none()
@@ -24,8 +24,11 @@ Who imports from this file?
 # IMPORTS
 # ============================================================================
 from sqlalchemy import create_engine          # Builds the engine (DB connection)
+from sqlalchemy import event                  # Hooks into engine/pool lifecycle events
 from sqlalchemy.orm import sessionmaker        # Builds the session factory
-from sqlalchemy.orm import declarative_base    # Builds the Base class for ORM models
+from sqlalchemy.orm import raiseload          # "No lazy loads" loader option (DEBUG)
+from sqlalchemy.orm import DeclarativeBase     # Parent class for ORM models (SQLAlchemy 2.0)
+from sqlalchemy.pool import QueuePool, StaticPool  # Connection pool implementations
 from dotenv import load_dotenv                 # Reads .env file into os.environ
 import os
 
@@ -41,11 +44,60 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./hospital.db")
 
+# Connection pool tuning:
+#   pool_size / max_overflow → up to 10 persistent + 20 burst connections, so
+#                              concurrent requests on FastAPI's threadpool each
+#                              get their own connection (safe for reads under WAL)
+#   pool_pre_ping            → cheap liveness check on checkout, drops stale connections
+#   pool_recycle             → replace connections older than 30 minutes
+# An in-memory database only exists inside the connection that created it, so
+# that case gets a StaticPool (one shared connection) instead.
+POOL_SIZE = 10
+MAX_OVERFLOW = 20
+
+if DATABASE_URL in ("sqlite://", "sqlite:///:memory:"):
+    pool_options = {"poolclass": StaticPool}
+else:
+    pool_options = {
+        "poolclass": QueuePool,
+        "pool_size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+# check_same_thread=False lets pooled SQLite connections move between FastAPI's
+# worker threads; it is a sqlite3-only argument that other drivers reject.
+connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args=connect_args,
+    # Size of the LRU cache of compiled SQL strings (default 500). Every select()
+    # in crud.py is compiled once and then reused; a larger cache keeps all of
+    # them (and every search_staff filter combination) resident.
+    query_cache_size=1200,
+    **pool_options,
 )
 
+
+# SQLite settings, applied to every new pooled DBAPI connection (the PRAGMAs
+# are per-connection). Same list in app/ and Cr_StaffContactInformation/; the
+# reasons are in README.md, "SQLite".
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")      # negative = KiB → 64 MB
+        cursor.execute("PRAGMA mmap_size=268435456")    # 256 MB
+        cursor.execute("PRAGMA busy_timeout=5000")      # milliseconds
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA analysis_limit=400")     # rows per index for ANALYZE/optimize
+        cursor.close()
+
 # ============================================================================
 # STEP 2 — THE SESSION FACTORY (SessionLocal)
 # ============================================================================
@@ -65,10 +117,29 @@ SessionLocal = sessionmaker(
     autoflush=False,
 )
 
+# DEBUG=1 (development/tests only): every relationship the code did not load
+# up front with joinedload/selectinload/contains_eager raises instead of
+# quietly emitting one lazy SELECT per object — the "N+1 queries" problem —
+# so a missing eager load fails loudly instead of slowing down in production.
+# The listener is attached to SessionLocal only, not to every Session in the
+# process; tests/conftest.py attaches it to its own session factory.
+def raise_on_lazy_load(orm_execute_state):
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
+if os.getenv("DEBUG", "0") == "1":
+    event.listen(SessionLocal, "do_orm_execute", raise_on_lazy_load)
+
 # ============================================================================
 # STEP 3 — THE DECLARATIVE BASE
 # ============================================================================
-# declarative_base() returns a Base class.
+# Base subclasses SQLAlchemy 2.0's DeclarativeBase (the typed successor of the
+# legacy declarative_base() factory).
 # Every ORM model in this project (e.g., Specialty in models.py) will inherit
 # from this Base. When a class inherits from Base, SQLAlchemy registers it
 # internally and knows its table name and column definitions.
@@ -78,7 +149,8 @@ SessionLocal = sessionmaker(
 # iterates over every registered model and issues:
 #   CREATE TABLE IF NOT EXISTS specialties (...);
 # for each one that doesn't already exist in the database.
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
 
 
 # ============================================================================
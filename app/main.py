@@ -5,28 +5,102 @@ Single Responsibility: Application entry point and composition root.
 
 This file:
   1. Creates the FastAPI application instance
-  2. Creates all database tables on startup
+  2. Creates all database tables on startup (only if AUTO_CREATE_TABLES=1),
+     and the indexes added to the models since, when they are missing
   3. Mounts the specialties router under /api/v1
   4. Provides a root health-check endpoint
 
 Imported by: Uvicorn (when booting the server)
 Imports from:
-  - fastapi (FastAPI)
-  - app.database (engine, Base)
+  - orjson
+  - fastapi (FastAPI, Response, ORJSONResponse)
+  - anyio (to_thread)
+  - app.database (engine, Base, POOL_SIZE, MAX_OVERFLOW)
   - app.routers (specialties)
 """
 
+import os
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from app.database import engine, Base
+import orjson
+from anyio import to_thread
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import inspect
+from app.database import engine, Base, POOL_SIZE, MAX_OVERFLOW
+from app.models import Specialty, Staff
 from app.routers import specialties, staff
 
+
+# Indexes added to the models after the first databases (hospital.db included)
+# were created. create_all() only creates indexes together with a NEW table, so
+# on an existing database they would never appear; they are created at startup
+# instead, when missing. ix_specialties_name_lower is UNIQUE: if two names
+# already differ only by case, startup fails until the duplicate is removed.
+_ADDED_INDEX_NAMES = {"ix_specialties_name_lower", "ix_staff_department_id", "ix_staff_specialty_id"}
+_ADDED_INDEXES = [
+    index
+    for table in (Specialty.__table__, Staff.__table__)
+    for index in table.indexes
+    if index.name in _ADDED_INDEX_NAMES
+]
+
+
+def _index_exists(connection, index) -> bool:
+    if connection.dialect.name == "sqlite":
+        # SQLAlchemy can't reflect SQLite expression indexes (LOWER(name))
+        row = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (index.name,)
+        ).first()
+        return row is not None
+    return inspect(connection).has_index(index.table.name, index.name)
+
+
+def create_missing_indexes(connection) -> bool:
+    """
+    Create each of _ADDED_INDEXES that doesn't exist yet (on existing tables).
+    Returns True if at least one index was created.
+    """
+    tables = set(inspect(connection).get_table_names())
+    created = False
+    for index in _ADDED_INDEXES:
+        if index.table.name in tables and not _index_exists(connection, index):
+            index.create(bind=connection)
+            created = True
+    return created
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # This runs when the server starts
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        # Table creation is a development convenience: create_all inspects every
+        # model's table on each worker boot. Opt in with AUTO_CREATE_TABLES=1;
+        # deployed databases should already have their schema (migrations).
+        auto_create_tables = os.getenv("AUTO_CREATE_TABLES", "0") == "1"
+        if auto_create_tables:
+            Base.metadata.create_all(bind=connection)
+        indexes_created = create_missing_indexes(connection)
+        if engine.dialect.name == "sqlite":
+            # Planner statistics (README.md, "SQLite"): a full ANALYZE when
+            # tables or indexes may have just been created, so the new indexes
+            # are actually chosen; otherwise PRAGMA optimize, which only
+            # re-analyzes tables whose statistics are missing or stale.
+            if auto_create_tables or indexes_created:
+                connection.exec_driver_sql("ANALYZE")
+            else:
+                connection.exec_driver_sql("PRAGMA optimize")
+
+    # The endpoints are sync (def), so each request runs on AnyIO's worker
+    # thread pool and holds one pooled connection. AnyIO defaults to 40
+    # threads; cap it at the pool's capacity so extra requests queue for a
+    # thread instead of timing out waiting for a connection.
+    to_thread.current_default_thread_limiter().total_tokens = POOL_SIZE + MAX_OVERFLOW
+
     yield
     # This runs when the server stops
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as connection:
+            connection.exec_driver_sql("PRAGMA optimize")
 
 
 # DATABASE INITIALIZATION is now handled by the lifespan context below.
@@ -41,7 +115,10 @@ app = FastAPI(
     title="Hospital Specialty Catalog",
     version="1.0.0",
     description="API for managing medical specialties in the Hospital Management System.",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # ORJSONResponse encodes JSON (including the created_at datetimes) in
+    # native code instead of the stdlib json module.
+    default_response_class=ORJSONResponse
 )
 
 # ============================================================================
@@ -57,14 +134,46 @@ app.include_router(staff.router, prefix="/api/v1")
 # ============================================================================
 # 4. HEALTH CHECK ENDPOINT
 # ============================================================================
+# The payload never changes, so it is encoded to JSON bytes once at import time
+# instead of on every probe (load balancers may hit this endpoint many times a
+# second). Each request still gets its own Response object wrapping the shared
+# bytes, so middleware adding headers can't leak them into later responses.
+# no-cache: proxies must not answer a liveness probe from a stale copy.
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "message": "Hospital Management API is running",
+    "service": "Specialty Catalog"
+})
+_HEALTH_HEADERS = {"Cache-Control": "no-cache"}
+
+
 @app.get("/", tags=["Health"])
-def health_check():
+async def health_check():
     """
     Root health check endpoint.
     Used by load balancers, Docker, or Kubernetes to verify the API is alive.
     """
-    return {
-        "status": "ok",
-        "message": "Hospital Management API is running",
-        "service": "Specialty Catalog"
-    }
+    # async def: nothing here blocks, so FastAPI runs it directly on the event
+    # loop instead of dispatching it to the worker thread pool.
+    return Response(content=_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS)
+
+
+# ============================================================================
+# 5. PRODUCTION ENTRY POINT
+# ============================================================================
+if __name__ == "__main__":
+    # python -m app.main
+    # uvloop (event loop) and httptools (HTTP parser) are the C-accelerated
+    # implementations bundled with uvicorn[standard]; select them explicitly so
+    # a missing extra fails loudly instead of silently falling back to asyncio/h11.
+    # Each worker is a separate process with its own connection pool and cache.
+    import uvicorn
+
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("HOST", "127.0.0.1"),
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WORKERS", "4")),
+        loop="uvloop",
+        http="httptools",
+    )
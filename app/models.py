@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Date, Time, Numeric, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Date, Time, Numeric, JSON, Boolean, Index
 from datetime import datetime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -28,6 +28,14 @@ class Specialty(Base):
 
     staff_members = relationship("Staff", back_populates="specialty")
 
+    # create_specialty's duplicate check compares LOWER(name); the plain index on
+    # `name` can't serve that predicate, this expression index can. It is UNIQUE
+    # so the database itself rejects "cardiology" next to an existing
+    # "Cardiology", even between two concurrent inserts.
+    __table_args__ = (
+        Index("ix_specialties_name_lower", func.lower(name), unique=True),
+    )
+
 
 class Staff(Base):
     __tablename__ = "staff"
@@ -42,8 +50,9 @@ class Staff(Base):
     status = Column(String(50), default='Online')
     role_level = Column(String(50))
 
-    department_id = Column(Integer, ForeignKey("departments.id", ondelete="RESTRICT"))
-    specialty_id = Column(Integer, ForeignKey("specialties.id", ondelete="RESTRICT"))
+    # Indexed: search_staff joins departments/specialties through these columns
+    department_id = Column(Integer, ForeignKey("departments.id", ondelete="RESTRICT"), index=True)
+    specialty_id = Column(Integer, ForeignKey("specialties.id", ondelete="RESTRICT"), index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # URL path to the employee's profile picture storage
@@ -9,13 +9,19 @@ It handles routing, validation (via schemas), and calls the CRUD layer for work.
 
 Imported by: app/main.py
 Imports from:
-  - fastapi (APIRouter, Depends, HTTPException, status)
+  - hashlib, orjson (ETag of the encoded list)
+  - fastapi (APIRouter, Depends, HTTPException, Query, Request, Response, status,
+             ORJSONResponse)
   - sqlalchemy.orm (Session)
   - app (crud, schemas)
   - app.database (SessionLocal)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -37,17 +43,81 @@ router = APIRouter(
 # ============================================================================
 # GET /specialties
 # ============================================================================
+# The endpoints below return data straight from the specialties table,
+# whose columns already guarantee SpecialtyOut's types, so it is not run
+# through the response model again (FastAPI would validate it, re-serialize it
+# and pass it through jsonable_encoder). Instead the SpecialtyOut fields are
+# copied into a plain dict that ORJSONResponse encodes (datetimes included) in
+# one native-code pass. The schema is still published for /docs via `responses=`.
+_SPECIALTY_OUT_FIELDS = tuple(schemas.SpecialtyOut.model_fields)
+
+
+def _specialty_json(specialty) -> dict:
+    """
+    SpecialtyOut-shaped dict from a Specialty object or a Core row.
+    """
+    return {field: getattr(specialty, field) for field in _SPECIALTY_OUT_FIELDS}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match uses the weak comparison (RFC 9110): a W/ prefix is ignored
+    on either side, and "*" matches any current representation.
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @router.get(
     "/",
-    response_model=List[schemas.SpecialtyOut],
-    status_code=status.HTTP_200_OK
+    response_model=None,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": List[schemas.SpecialtyOut]}}
 )
-def get_all_specialties(db: Session = Depends(get_db)):
+def get_all_specialties(
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of specialties to skip"),
+    limit: int | None = Query(None, ge=1, description="Maximum number of specialties to return (default: all)"),
+    after_id: int | None = Query(None, ge=0, description="Return only specialties with an id greater than this one (keyset cursor)"),
+    db: Session = Depends(get_db)
+) -> Response:
     """
-    Retrieve all specialties from the database.
+    Retrieve specialties from the database, optionally paginated.
+
+    Prefer after_id + limit for paging: send the X-Next-Cursor header of one
+    page as after_id to get the next one (the header is absent once a page
+    comes back short, i.e. there is nothing more to read). skip/limit still
+    work, but deep offsets get slower the further in they go.
+    The total number of specialties is returned in the X-Total-Count header.
+
+    Responses carry an ETag: a client that sends it back in If-None-Match
+    gets an empty 304 Not Modified while the page is unchanged.
     """
-    # Simply delegate to the CRUD layer.
-    return crud.get_all_specialties(db=db)
+    # The CRUD layer returns the page and the total from a single query
+    # (served from its in-memory cache while fresh).
+    items, total = crud.get_specialties_page(db=db, skip=skip, limit=limit, after_id=after_id)
+
+    headers = {"X-Total-Count": str(total), "Cache-Control": "no-cache"}
+    if limit is not None and len(items) == limit:
+        headers["X-Next-Cursor"] = str(items[-1].id)
+
+    # The ETag is a hash of the exact bytes we would send, so it changes as
+    # soon as the page (or the total) does. no-cache above makes clients
+    # revalidate every time, which costs them a 304 instead of the full list.
+    body = orjson.dumps([_specialty_json(row) for row in items])
+    digest = hashlib.blake2b(body, digest_size=8)
+    digest.update(headers["X-Total-Count"].encode())
+    etag = f'"{digest.hexdigest()}"'
+    headers["ETag"] = etag
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(body, media_type="application/json", headers=headers)
 
 
 # ============================================================================
@@ -55,10 +125,11 @@ def get_all_specialties(db: Session = Depends(get_db)):
 # ============================================================================
 @router.get(
     "/{specialty_id}",
-    response_model=schemas.SpecialtyOut,
-    status_code=status.HTTP_200_OK
+    response_model=None,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": schemas.SpecialtyOut}}
 )
-def get_specialty(specialty_id: int, db: Session = Depends(get_db)):
+def get_specialty(specialty_id: int, db: Session = Depends(get_db)) -> ORJSONResponse:
     """
     Retrieve a specific specialty by its ID.
     """
@@ -68,33 +139,47 @@ def get_specialty(specialty_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Specialty not found"
         )
-    return specialty
+    return ORJSONResponse(_specialty_json(specialty))
 
 
 # ============================================================================
 # POST /specialties
 # ============================================================================
+# A duplicate name is an expected outcome of POST, not an error in our code, so
+# the 409 is returned as a plain response instead of raising HTTPException and
+# going through Starlette's exception middleware. Its body never varies, so it
+# is encoded to JSON bytes once at import time.
+_SPECIALTY_EXISTS_BODY = orjson.dumps({"detail": "Specialty already exists"})
+
+
 @router.post(
     "/",
-    response_model=schemas.SpecialtyOut,
-    status_code=status.HTTP_201_CREATED
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {"model": schemas.SpecialtyOut},
+        status.HTTP_409_CONFLICT: {"description": "Specialty already exists"},
+    }
 )
 def create_specialty(
-    specialty: schemas.SpecialtyCreate, 
+    specialty: schemas.SpecialtyCreate,
     db: Session = Depends(get_db)
-):
+) -> Response:
     """
     Create a new specialty.
     """
-    # 1. Check if the specialty already exists (Case-Insensitive check happens in CRUD)
-    existing_specialty = crud.get_specialty_by_name(db=db, name=specialty.name)
-    
-    # 2. If it exists, abort the request and return 409 Conflict
-    if existing_specialty:
-        raise HTTPException(
+    # 1. Try to create it. The CRUD layer checks for a duplicate name
+    #    (case-insensitive) and inserts in a single statement.
+    new_specialty = crud.create_specialty(db=db, specialty=specialty)
+
+    # 2. If it already existed, nothing was inserted: return 409 Conflict
+    if new_specialty is None:
+        return Response(
+            content=_SPECIALTY_EXISTS_BODY,
             status_code=status.HTTP_409_CONFLICT,
-            detail="Specialty already exists"
+            media_type="application/json",
         )
-    
-    # 3. If it doesn't exist, proceed with creation
-    return crud.create_specialty(db=db, specialty=specialty)
+
+    # The row was just written from a validated SpecialtyCreate and read back
+    # via RETURNING, so it is serialized directly like the GET endpoints.
+    return ORJSONResponse(_specialty_json(new_specialty), status_code=status.HTTP_201_CREATED)
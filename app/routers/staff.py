@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -13,13 +15,42 @@ router = APIRouter(
     tags=["Staff"]
 )
 
+# =====================================================================
+# RESPONSE SERIALIZATION
+# =====================================================================
+# Both endpoints return StaffContactOut-shaped JSON built straight from the
+# loaded Staff rows. Building StaffContactOut objects and then letting FastAPI
+# validate them again through response_model checked every field (including
+# the expensive EmailStr) twice per row; the emails were already validated
+# when they were stored. ORJSONResponse encodes the plain dicts (datetimes
+# included) in one native-code pass, and `responses=` keeps the schema in /docs.
+def _staff_contact_json(staff) -> dict:
+    """
+    StaffContactOut-shaped dict for a Staff row with user/department/specialty loaded.
+    """
+    return {
+        "id": staff.id,
+        "first_name": staff.first_name,
+        "last_name": staff.last_name,
+        "email": staff.user.email if staff.user else "no-email@example.com",
+        "phone_number": staff.phone_number,
+        "role_level": staff.role_level,
+        "status": staff.status,
+        "profile_pic": staff.profile_pic,
+        "department": staff.department.name if staff.department else None,
+        "specialty": staff.specialty.name if staff.specialty else None,
+        "created_at": staff.created_at,
+    }
+
+
 # =====================================================================
 # GET /staff/search
 # =====================================================================
 @router.get(
     "/search",
-    response_model=List[schemas.StaffContactOut],
-    status_code=status.HTTP_200_OK
+    response_model=None,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": List[schemas.StaffContactOut]}}
 )
 def search_staff_endpoint(
     name: str | None = None,
@@ -27,7 +58,7 @@ def search_staff_endpoint(
     role: str | None = None,
     location: str | None = None,
     db: Session = Depends(get_db)
-):
+) -> ORJSONResponse:
     """
     Endpoint to search staff contacts.
     Accepts optional query parameters:
@@ -46,36 +77,36 @@ def search_staff_endpoint(
             detail="No staff found with given criteria"
         )
 
-    return [
-        schemas.StaffContactOut(
-            id=staff.id,
-            first_name=staff.first_name,
-            last_name=staff.last_name,
-            email=staff.user.email if staff.user else "no-email@example.com",
-            phone_number=staff.phone_number,
-            role_level=staff.role_level,
-            status=staff.status,
-            profile_pic=staff.profile_pic,
-            department=staff.department.name if staff.department else None,
-            specialty=staff.specialty.name if staff.specialty else None,
-            created_at=staff.created_at
-        )
-        for staff in results
-    ]
+    return ORJSONResponse([_staff_contact_json(staff) for staff in results])
 
 # =====================================================================
 # PATCH /staff/update-profile
 # =====================================================================
 @router.patch(
     "/update-profile",
-    response_model=schemas.StaffContactOut,
-    status_code=status.HTTP_200_OK
+    response_model=None,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": schemas.StaffContactOut}}
 )
 def update_profile_endpoint(
     payload: schemas.StaffSelfUpdate,
     db: Session = Depends(get_db)
-):
-    updated_staff = crud.update_staff_contact_info(db, payload)
+) -> ORJSONResponse:
+    # The unique index on users.email rejects a duplicate inside the UPDATE
+    # itself (no separate "is it taken?" SELECT); the CRUD transaction has
+    # already been rolled back when the error reaches us.
+    try:
+        updated_staff = crud.update_staff_contact_info(db, payload)
+    except IntegrityError:
+        # Only an email that another account already has means "email taken";
+        # any other constraint failure is a bug and must not be reported as a
+        # conflict.
+        if payload.email is None or not crud.email_in_use(db, payload.email):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Email already in use"
+        )
 
     if not updated_staff:
         raise HTTPException(
@@ -83,16 +114,4 @@ def update_profile_endpoint(
             detail=f"Staff with ID {payload.staff_id} not found"
         )
 
-    return schemas.StaffContactOut(
-        id=updated_staff.id,
-        first_name=updated_staff.first_name,
-        last_name=updated_staff.last_name,
-        email=updated_staff.user.email,
-        phone_number=updated_staff.phone_number,
-        role_level=updated_staff.role_level,
-        status=updated_staff.status,
-        profile_pic=updated_staff.profile_pic,
-        department=updated_staff.department.name if updated_staff.department else None,
-        specialty=updated_staff.specialty.name if updated_staff.specialty else None,
-        created_at=updated_staff.created_at
-    )
\ No newline at end of file
+    return ORJSONResponse(_staff_contact_json(updated_staff))
@@ -145,6 +145,14 @@ class StaffSelfUpdate(BaseModel):
     # Seguridad: Si el JSON trae 'role_level', FastAPI lo rechazará automáticamente.
     model_config = ConfigDict(extra="forbid")
 
+    @field_validator("email")
+    @classmethod
+    def email_not_null(cls, value):
+        # El email se puede omitir, pero no enviar como null: users.email es NOT NULL
+        if value is None:
+            raise ValueError("Email cannot be null")
+        return value
+
 class StaffContactOut(BaseModel):
     id: int
     first_name: str
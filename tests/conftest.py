@@ -0,0 +1,151 @@
+"""
+tests/conftest.py
+-----------------
+Single Responsibility: Test database and fixtures shared by every test module.
+
+Loaded by pytest before any test module, so it is also where the app is kept
+away from the real database: `with TestClient(app)` runs the app's lifespan,
+which connects through the global engine in app.database. DATABASE_URL is
+pointed at an in-memory SQLite database BEFORE anything imports the app, so
+the test run never opens (or writes to) the tracked hospital.db file.
+
+Imports from: app.main (app instance), app.database (Base, get_db, raise_on_lazy_load), app.crud
+"""
+
+import os
+
+os.environ["DATABASE_URL"] = "sqlite://"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import crud
+from app.main import app
+from app.database import Base, get_db, raise_on_lazy_load
+
+# ---------------------------------------------------------------------------
+# Test Database Configuration
+# ---------------------------------------------------------------------------
+# A SEPARATE in-memory SQLite database for tests. StaticPool hands every
+# session the same single connection, so all of them (and the TestClient's
+# worker threads) see the same in-memory database.
+SQLALCHEMY_TEST_DATABASE_URL = "sqlite://"
+
+test_engine = create_engine(
+    SQLALCHEMY_TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+# DEBUG=1 pytest: lazy relationship loads raise here too, as with SessionLocal
+if os.getenv("DEBUG", "0") == "1":
+    event.listen(TestingSessionLocal, "do_orm_execute", raise_on_lazy_load)
+
+
+def override_get_db():
+    """
+    Override the get_db dependency to use the test database session instead
+    of the production SessionLocal. FastAPI's dependency injection system
+    allows this without modifying any application code.
+    """
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def clear_test_db():
+    """
+    Delete every row from every table (children before parents, so foreign
+    keys are never violated). Much cheaper than dropping and re-creating the
+    schema, and the tables/indexes stay in place for the next test.
+    """
+    with test_engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+# ---------------------------------------------------------------------------
+# Pytest Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_schema():
+    """
+    Create all tables in the test DB once for the whole run, drop them at the end.
+    """
+    Base.metadata.create_all(bind=test_engine)
+    yield
+    Base.metadata.drop_all(bind=test_engine)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_test_db():
+    """
+    Fixture that runs before and after EVERY test function.
+    - Before: Points the app at the test DB
+    - After:  Empties all tables so the next test starts clean
+    This guarantees test isolation — no test pollutes the next.
+    """
+    # The specialties list is cached in memory; don't serve the previous test's rows
+    crud.clear_specialties_cache()
+    # Override the production DB dependency with the test DB
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+    # Teardown: empty all tables after each test
+    clear_test_db()
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def client():
+    """
+    Provides a TestClient instance that makes real HTTP requests
+    to the FastAPI app without starting an actual server.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    """
+    A session on the test database, for tests that call the CRUD layer
+    directly or seed rows. Closed after the test, before the tables are emptied.
+    """
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="function")
+def clear_db():
+    """
+    Returns a function that empties every table, for tests that need a clean
+    database again halfway through.
+    """
+    return clear_test_db
+
+
+@pytest.fixture(scope="function")
+def sql_statements():
+    """
+    Collects every SQL statement sent to the test database while the test runs.
+    Used to prove that related rows are loaded eagerly, not one query per row,
+    and that bulk writes are batched.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine, "before_cursor_execute", record)
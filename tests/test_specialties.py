@@ -8,83 +8,32 @@ against an in-memory SQLite test database — NOT the production hospital.db fil
 
 Test coverage:
   - POST /api/v1/specialties   → 201 Created (success)
-  - POST /api/v1/specialties   → 422 Unprocessable Entity (missing required field)
-  - POST /api/v1/specialties   → 409 Conflict (duplicate name)
+  - POST /api/v1/specialties   → 422 Unprocessable Entity (missing field or body, malformed JSON, non-JSON Content-Type)
+  - POST /api/v1/specialties   → 409 Conflict (duplicate name, incl. accented uppercase)
   - GET  /api/v1/specialties   → 200 OK (empty list)
   - GET  /api/v1/specialties   → 200 OK (list with items after creation)
+  - GET  /api/v1/specialties?skip=&limit= → 200 OK (one page + X-Total-Count)
+  - GET  /api/v1/specialties?after_id=&limit= → 200 OK (keyset page, X-Next-Cursor)
+  - GET  /api/v1/specialties   → cached list refreshed after a create
+  - GET  /api/v1/specialties   → 304 Not Modified for a matching If-None-Match (weak or *)
   - GET  /api/v1/specialties/{id} → 200 OK (single item)
   - GET  /api/v1/specialties/{id} → 404 Not Found (non-existent id)
+  - crud.create_specialties_bulk  → multi-row insert across several batches
+  - GET  /openapi.json         → 200 OK (servers lists the proxy prefix)
+  - app.main.create_missing_indexes → indexes added to the models reach existing tables
 
-Imports from: app.main (app instance), app.database (Base, engine, get_db)
+Imports from: app.main (app instance), app.crud, app.schemas
 """
 
-import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.main import app
-from app.database import Base, get_db
+from app import crud
+from app.main import app, create_missing_indexes
+from app.schemas import SpecialtyCreate
 
-# ---------------------------------------------------------------------------
-# Test Database Configuration
-# ---------------------------------------------------------------------------
-# Use a SEPARATE in-memory SQLite database for tests.
-# This ensures tests never touch the real hospital.db file.
-# Each test run starts with a clean, empty database.
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite://"
-
-test_engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-
-
-def override_get_db():
-    """
-    Override the get_db dependency to use the test database session instead
-    of the production SessionLocal. FastAPI's dependency injection system
-    allows this without modifying any application code.
-    """
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-# ---------------------------------------------------------------------------
-# Pytest Fixtures
-# ---------------------------------------------------------------------------
-
-@pytest.fixture(scope="function", autouse=True)
-def setup_test_db():
-    """
-    Fixture that runs before and after EVERY test function.
-    - Before: Creates all tables in the test DB
-    - After:  Drops all tables so the next test starts clean
-    This guarantees test isolation — no test pollutes the next.
-    """
-    Base.metadata.create_all(bind=test_engine)
-    # Override the production DB dependency with the test DB
-    app.dependency_overrides[get_db] = override_get_db
-    yield
-    # Teardown: drop all tables after each test
-    Base.metadata.drop_all(bind=test_engine)
-    app.dependency_overrides.clear()
-
-
-@pytest.fixture(scope="function")
-def client():
-    """
-    Provides a TestClient instance that makes real HTTP requests
-    to the FastAPI app without starting an actual server.
-    """
-    with TestClient(app) as test_client:
-        yield test_client
+# The in-memory test database and the client / db_session / setup_test_db
+# fixtures live in tests/conftest.py: each test starts with empty tables and the app's get_db
+# pointed at that database, so tests never touch the real hospital.db file.
 
 
 # ---------------------------------------------------------------------------
@@ -134,6 +83,35 @@ class TestCreateSpecialty:
 
         assert response.status_code == 422
 
+    def test_create_specialty_malformed_json(self, client):
+        """A body that isn't valid JSON should return 422 with a body error."""
+        response = client.post(
+            "/api/v1/specialties/",
+            content='{"name": "Cardiology"',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][0] == "body"
+
+    def test_create_specialty_non_json_content_type(self, client):
+        """JSON sent as text/plain is not parsed: 422, like FastAPI's own body handling."""
+        response = client.post(
+            "/api/v1/specialties/",
+            content='{"name": "Cardiology"}',
+            headers={"Content-Type": "text/plain"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body"]
+
+    def test_create_specialty_missing_body(self, client):
+        """No body at all is reported as a missing body, not as invalid JSON."""
+        response = client.post("/api/v1/specialties/")
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "missing"
+
     def test_create_specialty_duplicate_name(self, client):
         """Duplicate name should return 409 Conflict, not 500."""
         payload = {"name": "Cardiology", "description": "Heart stuff"}
@@ -144,6 +122,15 @@ class TestCreateSpecialty:
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"]
 
+    def test_create_specialty_duplicate_non_ascii_name(self, client):
+        """Duplicates with uppercase accented letters are still a 409."""
+        payload = {"name": "ÁREA QUIRÚRGICA"}
+        client.post("/api/v1/specialties/", json=payload)
+
+        response = client.post("/api/v1/specialties/", json=payload)
+
+        assert response.status_code == 409
+
 
 class TestGetSpecialties:
     """Tests for GET /api/v1/specialties"""
@@ -169,6 +156,115 @@ class TestGetSpecialties:
         assert "Cardiology" in names
         assert "Neurology" in names
 
+    def test_get_specialties_paginated(self, client):
+        """skip/limit return one page; X-Total-Count still reports every row."""
+        for name in ["Cardiology", "Neurology", "Oncology"]:
+            client.post("/api/v1/specialties/", json={"name": name})
+
+        response = client.get("/api/v1/specialties/", params={"skip": 1, "limit": 1})
+
+        assert response.status_code == 200
+        assert [item["name"] for item in response.json()] == ["Neurology"]
+        assert response.headers["X-Total-Count"] == "3"
+
+    def test_get_specialties_keyset_page(self, client):
+        """after_id returns the rows following the cursor; the total is unaffected."""
+        ids = [
+            client.post("/api/v1/specialties/", json={"name": name}).json()["id"]
+            for name in ["Cardiology", "Neurology", "Oncology"]
+        ]
+
+        response = client.get("/api/v1/specialties/", params={"after_id": ids[0], "limit": 1})
+
+        assert [item["name"] for item in response.json()] == ["Neurology"]
+        assert response.headers["X-Total-Count"] == "3"
+
+        last_page = client.get("/api/v1/specialties/", params={"after_id": ids[-1]})
+        assert last_page.json() == []
+        assert last_page.headers["X-Total-Count"] == "3"
+
+    def test_get_specialties_walk_pages_with_next_cursor(self, client):
+        """Following X-Next-Cursor visits every specialty once, then stops."""
+        names = ["Cardiology", "Neurology", "Oncology", "Pediatrics", "Radiology"]
+        for name in names:
+            client.post("/api/v1/specialties/", json={"name": name})
+
+        seen, params = [], {"limit": 2}
+        while True:
+            response = client.get("/api/v1/specialties/", params=params)
+            seen += [item["name"] for item in response.json()]
+            if "X-Next-Cursor" not in response.headers:
+                break
+            params = {"limit": 2, "after_id": response.headers["X-Next-Cursor"]}
+
+        assert seen == names
+
+    def test_get_specialties_page_past_the_end(self, client):
+        """A page past the last row is empty but keeps the real total."""
+        client.post("/api/v1/specialties/", json={"name": "Cardiology"})
+
+        response = client.get("/api/v1/specialties/", params={"skip": 5})
+
+        assert response.json() == []
+        assert response.headers["X-Total-Count"] == "1"
+
+    def test_get_specialties_cache_invalidated_on_create(self, client):
+        """A cached list must not hide a specialty created afterwards."""
+        client.post("/api/v1/specialties/", json={"name": "Cardiology"})
+        assert len(client.get("/api/v1/specialties/").json()) == 1
+
+        client.post("/api/v1/specialties/", json={"name": "Neurology"})
+
+        assert len(client.get("/api/v1/specialties/").json()) == 2
+
+    def test_get_specialties_cache_skips_page_read_before_clear(self, client, monkeypatch):
+        """A page read before a concurrent create's cache clear is not stored."""
+        client.post("/api/v1/specialties/", json={"name": "Cardiology"})
+        fetch_page = crud._fetch_specialties_page
+
+        def fetch_then_create(*args):
+            page = fetch_page(*args)
+            # Another request creates a specialty while this GET is in flight
+            client.post("/api/v1/specialties/", json={"name": "Neurology"})
+            return page
+
+        monkeypatch.setattr(crud, "_fetch_specialties_page", fetch_then_create)
+        assert len(client.get("/api/v1/specialties/").json()) == 1
+        monkeypatch.setattr(crud, "_fetch_specialties_page", fetch_page)
+
+        assert len(client.get("/api/v1/specialties/").json()) == 2
+
+    def test_get_specialties_etag_not_modified(self, client):
+        """Sending the ETag back returns 304 until the list changes."""
+        client.post("/api/v1/specialties/", json={"name": "Cardiology"})
+        etag = client.get("/api/v1/specialties/").headers["ETag"]
+
+        not_modified = client.get("/api/v1/specialties/", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+        client.post("/api/v1/specialties/", json={"name": "Neurology"})
+        changed = client.get("/api/v1/specialties/", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    def test_get_specialties_weak_etag_not_modified(self, client):
+        """A weak (W/) copy of the ETag, in a list of tags, still matches."""
+        client.post("/api/v1/specialties/", json={"name": "Cardiology"})
+        etag = client.get("/api/v1/specialties/").headers["ETag"]
+
+        response = client.get(
+            "/api/v1/specialties/", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+        assert response.status_code == 304
+
+    def test_get_specialties_wildcard_if_none_match(self, client):
+        """If-None-Match: * matches whatever the current list is."""
+        client.post("/api/v1/specialties/", json={"name": "Cardiology"})
+
+        response = client.get("/api/v1/specialties/", headers={"If-None-Match": "*"})
+        assert response.status_code == 304
+
     def test_get_specialty_by_id(self, client):
         """Should return a single specialty by its ID."""
         create_response = client.post("/api/v1/specialties/", json={"name": "Oncology"})
@@ -189,6 +285,32 @@ class TestGetSpecialties:
         assert "not found" in response.json()["detail"].lower()
 
 
+class TestBulkCreateSpecialties:
+    """Tests for crud.create_specialties_bulk (seed/import path)."""
+
+    def test_bulk_create_across_batches(self, client, db_session):
+        """Every item is inserted, even when the input spans several batches."""
+        items = [SpecialtyCreate(name=f"Specialty {i}") for i in range(7)]
+
+        inserted = crud.create_specialties_bulk(db_session, items, batch_size=3)
+
+        assert inserted == 7
+        response = client.get("/api/v1/specialties/")
+        assert len(response.json()) == 7
+
+    def test_bulk_create_one_insert_per_batch(self, client, db_session, sql_statements):
+        """Rows with and without a description still go out as one INSERT per batch."""
+        items = [
+            SpecialtyCreate(name=f"Specialty {i}", description="Desc" if i % 2 else None)
+            for i in range(6)
+        ]
+        crud.create_specialties_bulk(db_session, items, batch_size=3)
+
+        inserts = [statement for statement in sql_statements if statement.startswith("INSERT")]
+        assert len(inserts) == 2
+        assert len(client.get("/api/v1/specialties/").json()) == 6
+
+
 class TestHealthCheck:
     """Tests for the root health-check endpoint."""
 
@@ -198,3 +320,47 @@ class TestHealthCheck:
 
         assert response.status_code == 200
         assert "running" in response.json()["message"]
+        assert response.headers["Cache-Control"] == "no-cache"
+
+    def test_openapi_schema_served(self, client):
+        """The OpenAPI schema is served with every route in it, plus /docs and /redoc."""
+        response = client.get("/openapi.json")
+
+        assert response.status_code == 200
+        assert "/api/v1/specialties/" in response.json()["paths"]
+        assert "/openapi.json" not in response.json()["paths"]
+        request_body = response.json()["paths"]["/api/v1/specialties/"]["post"]["requestBody"]
+        assert request_body["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/SpecialtyCreate"
+        }
+        assert "SpecialtyCreate" in response.json()["components"]["schemas"]
+        assert "422" in response.json()["paths"]["/api/v1/specialties/"]["post"]["responses"]
+        assert client.get("/docs").status_code == 200
+        assert client.get("/redoc").status_code == 200
+
+    def test_openapi_schema_behind_proxy_prefix(self, monkeypatch):
+        """Behind a proxy prefix the schema lists it in `servers` and /docs points at it."""
+        # FastAPI builds the schema on the first /openapi.json request and keeps
+        # it; in a deployment every request carries the same prefix, so start
+        # from an unbuilt schema as a fresh process behind the proxy would.
+        monkeypatch.setattr(app, "openapi_schema", None)
+        monkeypatch.setattr(app, "servers", [])
+        with TestClient(app, root_path="/hospital") as proxied_client:
+            schema = proxied_client.get("/openapi.json").json()
+            docs = proxied_client.get("/docs").text
+
+        assert schema["servers"][0] == {"url": "/hospital"}
+        assert "/hospital/openapi.json" in docs
+
+
+class TestStartupIndexes:
+    """Tests for the indexes created at startup on an existing database."""
+
+    def test_missing_index_created_once(self, db_session):
+        """An index missing from an existing table is created, then left alone."""
+        connection = db_session.connection()
+        connection.exec_driver_sql("DROP INDEX ix_specialties_name_lower")
+
+        assert create_missing_indexes(connection) is True
+        assert create_missing_indexes(connection) is False
+        db_session.commit()
@@ -0,0 +1,193 @@
+"""
+tests/test_staff.py
+-------------------
+Single Responsibility: Integration tests for the /staff endpoints.
+
+These tests use FastAPI's TestClient against an in-memory SQLite test database
+— NOT the production hospital.db file.
+
+Test coverage:
+  - GET   /api/v1/staff/search          → 200 OK (contacts with department/specialty/email)
+  - GET   /api/v1/staff/search          → 404 Not Found (no match)
+  - GET   /api/v1/staff/search          → same number of SQL statements for 2 or 20 rows (no N+1)
+  - PATCH /api/v1/staff/update-profile  → 200 OK (email in users, phone in staff)
+  - PATCH /api/v1/staff/update-profile  → 409 Conflict (email used by another account)
+  - PATCH /api/v1/staff/update-profile  → 404 Not Found (non-existent id)
+  - PATCH /api/v1/staff/update-profile  → 422 Unprocessable Entity (null email)
+  - PATCH /api/v1/staff/update-profile  → 200 OK (email unchanged; session already in a transaction)
+  - PATCH /api/v1/staff/update-profile  → relationships loaded without extra lazy SELECTs
+
+Imports from: app.crud, app.models, app.schemas
+"""
+
+from datetime import date
+
+from sqlalchemy import select
+
+from app import crud
+from app.models import Department, Specialty, Staff, User
+from app.schemas import StaffSelfUpdate
+
+# Same in-memory test database and fixtures (client, db_session, clear_db,
+# sql_statements) as test_specialties.py, shared through tests/conftest.py.
+
+
+def seed_staff(db, count: int) -> list[int]:
+    """
+    Insert `count` staff members, each with their own user account, all in the
+    same department and specialty, through the session `db`. Returns the new
+    staff ids.
+    """
+    department = Department(name="Emergency")
+    specialty = Specialty(name="Cardiology")
+    db.add_all([department, specialty])
+    db.flush()
+
+    staff_members = []
+    for i in range(count):
+        user = User(email=f"doctor{i}@hospital.com", password="secret", role="staff")
+        db.add(user)
+        db.flush()
+        staff_members.append(Staff(
+            user_id=user.id,
+            first_name=f"Doctor{i}",
+            last_name="House",
+            start_date=date(2024, 1, 1),
+            role_level="Senior",
+            department_id=department.id,
+            specialty_id=specialty.id,
+        ))
+    db.add_all(staff_members)
+    db.commit()
+    return [staff.id for staff in staff_members]
+
+
+# ---------------------------------------------------------------------------
+# Test Cases
+# ---------------------------------------------------------------------------
+
+class TestSearchStaff:
+    """Tests for GET /api/v1/staff/search"""
+
+    def test_search_staff_returns_contacts(self, client, db_session):
+        """Each contact includes the email, department and specialty names."""
+        seed_staff(db_session, 2)
+
+        response = client.get("/api/v1/staff/search", params={"name": "Doctor1"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["email"] == "doctor1@hospital.com"
+        assert data[0]["department"] == "Emergency"
+        assert data[0]["specialty"] == "Cardiology"
+
+    def test_search_staff_no_match(self, client, db_session):
+        """No matching staff should return 404."""
+        seed_staff(db_session, 1)
+
+        response = client.get("/api/v1/staff/search", params={"name": "Nobody"})
+
+        assert response.status_code == 404
+
+    def test_search_staff_query_count_does_not_grow_with_rows(self, client, db_session, clear_db, sql_statements):
+        """Relationships are loaded eagerly: 20 rows cost as many queries as 2."""
+        seed_staff(db_session, 2)
+        sql_statements.clear()
+        client.get("/api/v1/staff/search")
+        queries_for_two = len(sql_statements)
+
+        clear_db()
+        seed_staff(db_session, 20)
+        sql_statements.clear()
+        response = client.get("/api/v1/staff/search")
+
+        assert len(response.json()) == 20
+        assert len(sql_statements) == queries_for_two
+
+
+class TestUpdateProfile:
+    """Tests for PATCH /api/v1/staff/update-profile"""
+
+    def test_update_profile_success(self, client, db_session):
+        """Email is saved on the user account, phone on the staff row."""
+        staff_id = seed_staff(db_session, 1)[0]
+
+        response = client.patch(
+            "/api/v1/staff/update-profile",
+            json={"staff_id": staff_id, "email": "new@hospital.com", "phone_number": "555-0100"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["email"] == "new@hospital.com"
+        assert data["phone_number"] == "555-0100"
+        assert data["department"] == "Emergency"
+
+    def test_update_profile_duplicate_email(self, client, db_session):
+        """An email already used by another account should return 409."""
+        staff_ids = seed_staff(db_session, 2)
+
+        response = client.patch(
+            "/api/v1/staff/update-profile",
+            json={"staff_id": staff_ids[0], "email": "doctor1@hospital.com"},
+        )
+
+        assert response.status_code == 409
+
+    def test_update_profile_null_email(self, client, db_session):
+        """An explicit null email is rejected by validation, not reported as a duplicate."""
+        staff_id = seed_staff(db_session, 1)[0]
+
+        response = client.patch(
+            "/api/v1/staff/update-profile",
+            json={"staff_id": staff_id, "email": None},
+        )
+
+        assert response.status_code == 422
+
+    def test_update_profile_not_found(self, client):
+        """A non-existent staff id should return 404."""
+        response = client.patch(
+            "/api/v1/staff/update-profile",
+            json={"staff_id": 999, "phone_number": "555-0100"},
+        )
+
+        assert response.status_code == 404
+
+    def test_update_profile_unchanged_email(self, client, db_session):
+        """Re-sending the current email still finds the staff member (200, not 404)."""
+        staff_id = seed_staff(db_session, 1)[0]
+
+        response = client.patch(
+            "/api/v1/staff/update-profile",
+            json={"staff_id": staff_id, "email": "doctor0@hospital.com"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["email"] == "doctor0@hospital.com"
+
+    def test_update_profile_in_open_transaction(self, db_session):
+        """The update commits through a session that already has a transaction open."""
+        staff_id = seed_staff(db_session, 1)[0]
+
+        db_session.execute(select(Staff.id))  # autobegins the session's transaction
+        updated = crud.update_staff_contact_info(
+            db_session, StaffSelfUpdate(staff_id=staff_id, phone_number="555-0100")
+        )
+        assert updated.phone_number == "555-0100"
+
+        db_session.expire_all()
+        assert db_session.get(Staff, staff_id).phone_number == "555-0100"
+
+    def test_update_profile_loads_relations_eagerly(self, client, db_session, sql_statements):
+        """Existence SELECT + UPDATE users + UPDATE staff + one joined SELECT; no lazy loads afterwards."""
+        staff_id = seed_staff(db_session, 1)[0]
+        sql_statements.clear()
+
+        client.patch(
+            "/api/v1/staff/update-profile",
+            json={"staff_id": staff_id, "email": "new@hospital.com", "phone_number": "555-0100"},
+        )
+
+        assert len(sql_statements) == 4